@@ -7,20 +7,137 @@ import os
 import requests
 import time
 import re
-from bs4 import BeautifulSoup
+import threading
+import sqlite3
+import itertools
+import logging
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 from typing import Dict, List, Tuple, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+
+# orjson parses noticeably faster than the standard library; fall back to json if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# Use a realistic user agent
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to CurseForge alive between requests.
+    
+    Returns:
+        A requests.Session with a pooled, retrying adapter mounted for HTTPS
+    """
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    
+    return session
+
+
+# Shared session so parallel workers reuse pooled connections
+_SESSION = create_session()
+
+# Separate connect and read timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Official CurseForge API, used instead of scraping when an API key is available
+CF_API_URL = "https://api.curseforge.com/v1"
+CF_API_BATCH_SIZE = 50
+
+# Older SQLite builds allow at most 999 bound parameters per statement
+SQLITE_MAX_PARAMS = 500
+
+# Prefer the C-based lxml parser, falling back to the pure-Python one if it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Mod titles are usually found among the page's <h1> elements alone, so try those first without building the rest of the tree
+_MOD_TITLE_STRAINER = SoupStrainer("h1")
+
+# CSS selectors tried in order when extracting names from scraped pages.
+# The fallback selectors need ancestors, so they run against a full parse.
+_MOD_TITLE_SELECTORS = ("h1.project-title", "h1.text-xl")
+_MOD_TITLE_FALLBACK_SELECTORS = ("main h1", ".project-header h1")
+_FILE_NAME_SELECTORS = (
+    # Exact class attribute match, like find("h2", class_="font-bold text-lg")
+    'h2[class="font-bold text-lg"]',
+    "h3.text-primary-500",
+    ".project-file-name",
+    "main h1",
+    ".project-file-page-header"
+)
+
+
+class RateLimiter:
+    """A thread-safe limiter that spaces out requests shared by all workers."""
+    
+    def __init__(self, delay: float = 0.5):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            delay: Minimum delay between the start of two requests in seconds (default: 0.5)
+        """
+        self.delay = max(delay, 0.0)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self) -> None:
+        """Block until the next request slot is available, sleeping only if needed."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 
 def extract_manifest(zip_path: str) -> Dict[str, Any]:
     """Extract and parse manifest.json from a zip file."""
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            if 'manifest.json' not in zip_ref.namelist():
+            try:
+                info = zip_ref.getinfo('manifest.json')
+            except KeyError:
                 raise ValueError(f"No manifest.json found in {zip_path}")
             
-            with zip_ref.open('manifest.json') as manifest_file:
-                return json.load(manifest_file)
+            with zip_ref.open(info) as manifest_file:
+                return _json_loads(manifest_file.read())
     except zipfile.BadZipFile:
         raise ValueError(f"File is not a valid zip archive: {zip_path}")
     except json.JSONDecodeError:
@@ -37,41 +154,58 @@ def compare_manifests(old_manifest: Dict[str, Any], new_manifest: Dict[str, Any]
     new_files = {item['projectID']: item for item in new_manifest.get('files', [])}
     
     # Find additions (in new but not in old)
-    additions = [new_files[project_id] for project_id in new_files if project_id not in old_files]
-    
-    # Find removals (in old but not in new)
-    removals = [old_files[project_id] for project_id in old_files if project_id not in new_files]
+    additions = [item for project_id, item in new_files.items() if project_id not in old_files]
     
-    # Find updates (same projectID but different fileID)
+    # Find removals (in old but not in new) and updates (same projectID but different fileID) in one walk
+    removals = []
     updates = []
-    for project_id in old_files:
-        if project_id in new_files and old_files[project_id]['fileID'] != new_files[project_id]['fileID']:
+    for project_id, old_item in old_files.items():
+        new_item = new_files.get(project_id)
+        if new_item is None:
+            removals.append(old_item)
+        elif old_item['fileID'] != new_item['fileID']:
             updates.append({
                 'projectID': project_id,
-                'old_fileID': old_files[project_id]['fileID'],
-                'new_fileID': new_files[project_id]['fileID']
+                'old_fileID': old_item['fileID'],
+                'new_fileID': new_item['fileID']
             })
     
     return additions, removals, updates
 
 
 class CurseForgeCache:
-    """A simple disk cache for CurseForge mod and file information."""
+    """A simple SQLite-backed disk cache for CurseForge mod and file information."""
     
     def __init__(self, cache_dir: str = ".cursecache"):
         """
         Initialize the cache.
         
         Args:
-            cache_dir: Directory to store cache files (default: .cursecache)
+            cache_dir: Directory to store the cache database (default: .cursecache)
         """
         self.cache_dir = cache_dir
-        self.mod_cache_dir = os.path.join(self.cache_dir, "mods")
-        self.file_cache_dir = os.path.join(self.cache_dir, "files")
+        self.db_path = os.path.join(self.cache_dir, "cache.sqlite")
         
-        # Create cache directories if they don't exist
-        os.makedirs(self.mod_cache_dir, exist_ok=True)
-        os.makedirs(self.file_cache_dir, exist_ok=True)
+        # Create cache directory if it doesn't exist
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Scrape workers write from several threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache("
+                "kind TEXT, pid INTEGER, fid INTEGER, data BLOB, "
+                "PRIMARY KEY(kind, pid, fid)) WITHOUT ROWID"
+            )
+            self.conn.commit()
+        
+        # In-memory layer in front of the database, keyed by project ID and (project ID, file ID).
+        # A None value records a known miss so repeated lookups never touch the disk.
+        self._mod_mem: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._file_mem: Dict[Tuple[int, int], Optional[Dict[str, Any]]] = {}
         
         # Cache stats
         self.mod_hits = 0
@@ -79,6 +213,89 @@ class CurseForgeCache:
         self.file_hits = 0
         self.file_misses = 0
     
+    def _select(self, kind: str, project_id: int, file_id: int) -> Optional[Dict[str, Any]]:
+        """Look up a single cache entry, returning None if it is missing or unreadable."""
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT data FROM cache WHERE kind=? AND pid=? AND fid=?",
+                    (kind, project_id, file_id)
+                ).fetchone()
+            return _json_loads(row[0]) if row else None
+        except (ValueError, sqlite3.Error) as e:
+            logger.warning("Error reading cache for %s %s/%s: %s", kind, project_id, file_id, e)
+            return None
+    
+    def _insert(self, kind: str, project_id: int, file_id: int, info: Dict[str, Any]) -> None:
+        """Insert or replace a single cache entry."""
+        data = _json_dumps(info)
+        
+        try:
+            with self._lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cache(kind, pid, fid, data) VALUES (?, ?, ?, ?)",
+                    (kind, project_id, file_id, data)
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Error writing cache for %s %s/%s: %s", kind, project_id, file_id, e)
+    
+    def warmup(self, project_ids: List[int]) -> None:
+        """
+        Preload cached mod information for many projects with batched IN queries.
+        
+        Args:
+            project_ids: CurseForge project IDs to preload
+        """
+        project_ids = [pid for pid in project_ids if pid not in self._mod_mem]
+        if not project_ids:
+            return
+        
+        try:
+            rows = []
+            with self._lock:
+                for chunk in _chunks(project_ids, SQLITE_MAX_PARAMS):
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(self.conn.execute(
+                        f"SELECT pid, data FROM cache WHERE kind='mod' AND fid=0 AND pid IN ({placeholders})",
+                        chunk
+                    ))
+            found = {pid: _json_loads(data) for pid, data in rows}
+            for pid in project_ids:
+                self._mod_mem[pid] = found.get(pid)
+        except (ValueError, sqlite3.Error) as e:
+            logger.warning("Error warming up mod cache: %s", e)
+    
+    def warmup_files(self, files: List[Tuple[int, int]]) -> None:
+        """
+        Preload cached file information for many files with batched IN queries.
+        
+        Args:
+            files: (project_id, file_id) tuples to preload
+        """
+        wanted = {file_tuple for file_tuple in files if file_tuple not in self._file_mem}
+        if not wanted:
+            return
+        
+        try:
+            rows = []
+            with self._lock:
+                # Filter on both IDs so old cached versions of a project's files are never loaded
+                for chunk in _chunks(list(wanted), SQLITE_MAX_PARAMS // 2):
+                    project_ids = list({pid for pid, _ in chunk})
+                    file_ids = list({fid for _, fid in chunk})
+                    rows.extend(self.conn.execute(
+                        f"SELECT pid, fid, data FROM cache WHERE kind='file' "
+                        f"AND pid IN ({','.join('?' * len(project_ids))}) "
+                        f"AND fid IN ({','.join('?' * len(file_ids))})",
+                        project_ids + file_ids
+                    ))
+            found = {(pid, fid): _json_loads(data) for pid, fid, data in rows if (pid, fid) in wanted}
+            for file_tuple in wanted:
+                self._file_mem[file_tuple] = found.get(file_tuple)
+        except (ValueError, sqlite3.Error) as e:
+            logger.warning("Error warming up file cache: %s", e)
+    
     def get_mod_info(self, project_id: int) -> Optional[Dict[str, Any]]:
         """
         Get mod information from cache.
@@ -89,15 +306,14 @@ class CurseForgeCache:
         Returns:
             Cached mod information or None if not in cache
         """
-        cache_path = os.path.join(self.mod_cache_dir, f"{project_id}.json")
+        if project_id in self._mod_mem:
+            info = self._mod_mem[project_id]
+        else:
+            info = self._mod_mem[project_id] = self._select('mod', project_id, 0)
         
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    self.mod_hits += 1
-                    return json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Error reading cache for mod {project_id}: {e}", file=sys.stderr)
+        if info:
+            self.mod_hits += 1
+            return info
         
         self.mod_misses += 1
         return None
@@ -110,13 +326,8 @@ class CurseForgeCache:
             project_id: CurseForge project ID
             mod_info: Mod information to cache
         """
-        cache_path = os.path.join(self.mod_cache_dir, f"{project_id}.json")
-        
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(mod_info, f, ensure_ascii=False, indent=2)
-        except OSError as e:
-            print(f"Error writing cache for mod {project_id}: {e}", file=sys.stderr)
+        self._mod_mem[project_id] = mod_info
+        self._insert('mod', project_id, 0, mod_info)
     
     def get_file_info(self, project_id: int, file_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -129,15 +340,15 @@ class CurseForgeCache:
         Returns:
             Cached file information or None if not in cache
         """
-        cache_path = os.path.join(self.file_cache_dir, f"{project_id}_{file_id}.json")
+        key = (project_id, file_id)
+        if key in self._file_mem:
+            info = self._file_mem[key]
+        else:
+            info = self._file_mem[key] = self._select('file', project_id, file_id)
         
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    self.file_hits += 1
-                    return json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Error reading cache for file {file_id} of project {project_id}: {e}", file=sys.stderr)
+        if info:
+            self.file_hits += 1
+            return info
         
         self.file_misses += 1
         return None
@@ -151,13 +362,13 @@ class CurseForgeCache:
             file_id: CurseForge file ID
             file_info: File information to cache
         """
-        cache_path = os.path.join(self.file_cache_dir, f"{project_id}_{file_id}.json")
-        
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(file_info, f, ensure_ascii=False, indent=2)
-        except OSError as e:
-            print(f"Error writing cache for file {file_id} of project {project_id}: {e}", file=sys.stderr)
+        self._file_mem[(project_id, file_id)] = file_info
+        self._insert('file', project_id, file_id, file_info)
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self.conn.close()
     
     def get_stats(self) -> Dict[str, int]:
         """Get cache hit/miss statistics."""
@@ -171,13 +382,26 @@ class CurseForgeCache:
         }
 
 
-def scrape_mod_info(project_id: int, cache: Optional[CurseForgeCache] = None) -> Dict[str, Any]:
+def _select_first(soup: BeautifulSoup, selectors: Tuple[str, ...]) -> Optional[Any]:
+    """Return the first element matched by any of the selectors, tried in order."""
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element:
+            return element
+    return None
+
+
+def scrape_mod_info(project_id: int, cache: Optional[CurseForgeCache] = None,
+                    session: Optional[requests.Session] = None,
+                    rate_limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
     """
     Scrape mod information from the CurseForge website.
     
     Args:
         project_id: The CurseForge project ID
         cache: Optional cache to use
+        session: Optional HTTP session to use (default: shared module session)
+        rate_limiter: Optional rate limiter to wait on before each request
         
     Returns:
         Dictionary containing mod information or None if request failed
@@ -188,6 +412,9 @@ def scrape_mod_info(project_id: int, cache: Optional[CurseForgeCache] = None) ->
         if cached_info:
             return cached_info
     
+    if session is None:
+        session = _SESSION
+    
     # Try different URL formats
     urls = [
         f"https://www.curseforge.com/minecraft/mc-mods/{project_id}",  # Try with direct project ID
@@ -196,25 +423,28 @@ def scrape_mod_info(project_id: int, cache: Optional[CurseForgeCache] = None) ->
     
     for url in urls:
         try:
-            # Use a realistic user agent
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            if rate_limiter:
+                rate_limiter.wait()
             
-            if response.status_code != 200:
-                continue  # Try next URL if this one fails
+            with session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if response.status_code != 200:
+                    # Discard the body so the connection goes back to the pool
+                    response.raw.drain_conn()
+                    continue  # Try next URL if this one fails
+                
+                # Decompress straight from the connection, skipping requests' chunked body handling
+                body = response.raw.read(decode_content=True)
                 
             # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(body, HTML_PARSER, parse_only=_MOD_TITLE_STRAINER)
             
             # Extract mod name from the title
-            title_element = soup.find("h1", class_="project-title") or soup.select_one("h1.text-xl")
+            title_element = _select_first(soup, _MOD_TITLE_SELECTORS)
             
             if not title_element:
-                # Try other common selectors
-                title_element = soup.select_one("main h1") or soup.select_one(".project-header h1")
+                # Try other common selectors on the full page
+                soup = BeautifulSoup(body, HTML_PARSER)
+                title_element = _select_first(soup, _MOD_TITLE_FALLBACK_SELECTORS)
             
             mod_name = title_element.text.strip() if title_element else f"Project-{project_id}"
             
@@ -231,12 +461,12 @@ def scrape_mod_info(project_id: int, cache: Optional[CurseForgeCache] = None) ->
                 
             return mod_info
         
-        except (requests.RequestException, AttributeError) as e:
-            print(f"Error with URL {url} for project {project_id}: {e}", file=sys.stderr)
+        except (requests.RequestException, Urllib3HTTPError, AttributeError) as e:
+            logger.warning("Error with URL %s for project %s: %s", url, project_id, e)
             continue  # Try next URL
     
     # If we get here, all URLs failed
-    print(f"Failed to scrape info for project {project_id}", file=sys.stderr)
+    logger.warning("Failed to scrape info for project %s", project_id)
     
     # Return minimal information with project ID
     minimal_info = {
@@ -252,7 +482,9 @@ def scrape_mod_info(project_id: int, cache: Optional[CurseForgeCache] = None) ->
     return minimal_info
 
 
-def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCache] = None) -> Dict[str, Any]:
+def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCache] = None,
+                     session: Optional[requests.Session] = None,
+                     rate_limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
     """
     Scrape file information from the CurseForge website.
     
@@ -260,6 +492,8 @@ def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCa
         project_id: The CurseForge project ID
         file_id: The CurseForge file ID
         cache: Optional cache to use
+        session: Optional HTTP session to use (default: shared module session)
+        rate_limiter: Optional rate limiter to wait on before each request
         
     Returns:
         Dictionary containing file information or None if request failed
@@ -269,6 +503,9 @@ def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCa
         cached_info = cache.get_file_info(project_id, file_id)
         if cached_info:
             return cached_info
+    
+    if session is None:
+        session = _SESSION
             
     # Try different URL formats
     urls = [
@@ -278,27 +515,23 @@ def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCa
     
     for url in urls:
         try:
-            # Use a realistic user agent
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
+            if rate_limiter:
+                rate_limiter.wait()
             
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code != 200:
-                continue  # Try next URL if this one fails
+            with session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if response.status_code != 200:
+                    # Discard the body so the connection goes back to the pool
+                    response.raw.drain_conn()
+                    continue  # Try next URL if this one fails
+                
+                # Decompress straight from the connection, skipping requests' chunked body handling
+                body = response.raw.read(decode_content=True)
                 
             # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(body, HTML_PARSER)
             
             # Try multiple ways to extract file name
-            file_name_element = (
-                soup.find("h2", class_="font-bold text-lg") or 
-                soup.find("h3", class_="text-primary-500") or
-                soup.select_one(".project-file-name") or
-                soup.select_one("main h1") or
-                soup.select_one(".project-file-page-header")
-            )
+            file_name_element = _select_first(soup, _FILE_NAME_SELECTORS)
             
             file_name = file_name_element.text.strip() if file_name_element else f"File-{file_id}"
             
@@ -316,12 +549,12 @@ def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCa
                 
             return file_info
         
-        except (requests.RequestException, AttributeError) as e:
-            print(f"Error with URL {url} for file {file_id} of project {project_id}: {e}", file=sys.stderr)
+        except (requests.RequestException, Urllib3HTTPError, AttributeError) as e:
+            logger.warning("Error with URL %s for file %s of project %s: %s", url, file_id, project_id, e)
             continue  # Try next URL
     
     # If we get here, all URLs failed
-    print(f"Failed to scrape info for file {file_id} of project {project_id}", file=sys.stderr)
+    logger.warning("Failed to scrape info for file %s of project %s", file_id, project_id)
     
     # Return minimal information
     minimal_info = {
@@ -338,103 +571,291 @@ def scrape_file_info(project_id: int, file_id: int, cache: Optional[CurseForgeCa
     return minimal_info
 
 
-def scrape_all_mod_info(manifest: Dict[str, Any], cache: Optional[CurseForgeCache] = None) -> Dict[int, Dict[str, Any]]:
+def _chunks(items: List[Any], size: int):
+    """Yield successive lists of at most size items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _api_data(response: requests.Response) -> List[Dict[str, Any]]:
+    """Return the entries under 'data' in a CurseForge API response, or an empty list if there are none."""
+    payload = response.json()
+    data = payload.get('data') if isinstance(payload, dict) else None
+    if not isinstance(data, list):
+        return []
+    return [entry for entry in data if isinstance(entry, dict)]
+
+
+def fetch_mods_batch(project_ids: List[int], api_key: str,
+                     session: Optional[requests.Session] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch mod information for many projects from the official CurseForge API.
+    
+    Args:
+        project_ids: CurseForge project IDs to fetch
+        api_key: CurseForge API key
+        session: Optional HTTP session to use (default: shared module session)
+        
+    Returns:
+        Dictionary mapping project IDs to mod information; IDs the API did not return are omitted
+    """
+    if session is None:
+        session = _SESSION
+    
+    headers = {"x-api-key": api_key, "Accept": "application/json"}
+    mod_info = {}
+    
+    # The API accepts a limited number of IDs per request
+    for chunk in _chunks(project_ids, CF_API_BATCH_SIZE):
+        try:
+            response = session.post(f"{CF_API_URL}/mods", json={"modIds": chunk},
+                                    headers=headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            
+            for mod in _api_data(response):
+                project_id = mod.get('id')
+                if project_id is None:
+                    continue  # Skip malformed entries; their IDs fall back to scraping
+                
+                links = mod.get('links')
+                website_url = links.get('websiteUrl') if isinstance(links, dict) else None
+                mod_info[project_id] = {
+                    "id": project_id,
+                    "name": mod.get('name') or f"Project-{project_id}",
+                    "url": website_url or f"https://www.curseforge.com/minecraft/mc-mods/{project_id}"
+                }
+        except (requests.RequestException, ValueError) as e:
+            logger.warning("Error fetching %d mods from the CurseForge API: %s", len(chunk), e)
+    
+    return mod_info
+
+
+def fetch_files_batch(files: List[Tuple[int, int]], api_key: str,
+                      session: Optional[requests.Session] = None) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    Fetch file information for many files from the official CurseForge API.
+    
+    Args:
+        files: (project_id, file_id) tuples to fetch
+        api_key: CurseForge API key
+        session: Optional HTTP session to use (default: shared module session)
+        
+    Returns:
+        Dictionary mapping (project_id, file_id) tuples to file information; files the API did not return are omitted
+    """
+    if session is None:
+        session = _SESSION
+    
+    headers = {"x-api-key": api_key, "Accept": "application/json"}
+    file_info = {}
+    
+    for chunk in _chunks(files, CF_API_BATCH_SIZE):
+        try:
+            response = session.post(f"{CF_API_URL}/mods/files", json={"fileIds": [fid for _, fid in chunk]},
+                                    headers=headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            
+            for file_data in _api_data(response):
+                project_id = file_data.get('modId')
+                file_id = file_data.get('id')
+                if project_id is None or file_id is None:
+                    continue  # Skip malformed entries; their files fall back to scraping
+                
+                file_name = file_data.get('fileName') or f"File-{file_id}"
+                file_info[(project_id, file_id)] = {
+                    "id": file_id,
+                    "fileName": file_name,
+                    "displayName": file_data.get('displayName') or file_name,
+                    "url": f"https://www.curseforge.com/minecraft/mc-mods/{project_id}/files/{file_id}"
+                }
+        except (requests.RequestException, ValueError) as e:
+            logger.warning("Error fetching %d files from the CurseForge API: %s", len(chunk), e)
+    
+    return file_info
+
+
+def scrape_all_mod_info(manifest: Dict[str, Any], cache: Optional[CurseForgeCache] = None,
+                        session: Optional[requests.Session] = None,
+                        max_workers: int = 3, delay: float = 0.5,
+                        api_key: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
     """
     Scrape information for all mods in a manifest file using parallel requests.
     
     Args:
         manifest: The parsed manifest.json
         cache: Optional cache to use
+        session: Optional HTTP session shared by all workers (default: shared module session)
+        max_workers: Maximum number of parallel workers (default: 3)
+        delay: Minimum delay between requests in seconds, shared by all workers (default: 0.5)
+        api_key: Optional CurseForge API key; when given, batch-fetch from the API before scraping
         
     Returns:
         Dictionary mapping project IDs to mod information
     """
-    project_ids = [item['projectID'] for item in manifest.get('files', [])]
-    mod_info = {}
-    
     # Deduplicate project IDs
-    project_ids = list(set(project_ids))
+    project_ids = list({item['projectID'] for item in manifest.get('files', [])})
+    mod_info = {}
     
-    print(f"Processing information for {len(project_ids)} mods...")
+    logger.info("Processing information for %d mods...", len(project_ids))
     
-    # Check cache first for all project IDs
+    # Check cache first for all project IDs, collecting the misses in one pass
+    to_scrape = project_ids
     if cache:
-        for pid in project_ids[:]:  # Create a copy to modify while iterating
+        cache.warmup(project_ids)
+        to_scrape = []
+        for pid in project_ids:
             cached_info = cache.get_mod_info(pid)
             if cached_info:
                 mod_info[pid] = cached_info
-                project_ids.remove(pid)
+            else:
+                to_scrape.append(pid)
+    
+    # Batch-fetch the remaining project IDs from the API if possible
+    if to_scrape and api_key:
+        logger.info("Fetching information for %d mods from the CurseForge API...", len(to_scrape))
+        fetched = fetch_mods_batch(to_scrape, api_key, session)
+        for pid, result in fetched.items():
+            mod_info[pid] = result
+            if cache:
+                cache.set_mod_info(pid, result)
+        to_scrape = [pid for pid in to_scrape if pid not in fetched]
     
     # Only scrape the remaining project IDs
-    if project_ids:
-        print(f"Scraping information for {len(project_ids)} mods (not in cache)...")
+    if to_scrape:
+        logger.info("Scraping information for %d mods (not in cache)...", len(to_scrape))
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {executor.submit(scrape_mod_info, pid, cache): pid for pid in project_ids}
-            for future in futures:
+        if session is None:
+            session = _SESSION
+        rate_limiter = RateLimiter(delay)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(scrape_mod_info, pid, cache, session, rate_limiter): pid for pid in to_scrape}
+            # Handle results as they finish rather than in submission order
+            for future in as_completed(futures):
                 pid = futures[future]
                 try:
                     result = future.result()
                     if result:
                         mod_info[pid] = result
-                        print(f"Scraped info for {result.get('name', 'Unknown')} (ID: {pid})")
-                    # Add a small delay to avoid overwhelming the server
-                    time.sleep(0.5)
+                        logger.debug("Scraped info for %s (ID: %s)", result.get('name', 'Unknown'), pid)
                 except Exception as e:
-                    print(f"Error processing project {pid}: {e}", file=sys.stderr)
+                    logger.error("Error processing project %s: %s", pid, e)
     
     return mod_info
 
 
-def scrape_all_file_info(manifest: Dict[str, Any], cache: Optional[CurseForgeCache] = None) -> Dict[Tuple[int, int], Dict[str, Any]]:
+def scrape_all_file_info(manifest: Dict[str, Any], cache: Optional[CurseForgeCache] = None,
+                         session: Optional[requests.Session] = None,
+                         max_workers: int = 3, delay: float = 0.5,
+                         api_key: Optional[str] = None) -> Dict[Tuple[int, int], Dict[str, Any]]:
     """
     Scrape information for all files in a manifest using parallel requests.
     
     Args:
         manifest: The parsed manifest.json
         cache: Optional cache to use
+        session: Optional HTTP session shared by all workers (default: shared module session)
+        max_workers: Maximum number of parallel workers (default: 3)
+        delay: Minimum delay between requests in seconds, shared by all workers (default: 0.5)
+        api_key: Optional CurseForge API key; when given, batch-fetch from the API before scraping
         
     Returns:
         Dictionary mapping (project_id, file_id) tuples to file information
     """
     file_info = {}
-    files = [(item['projectID'], item['fileID']) for item in manifest.get('files', [])]
-    
     # Deduplicate file entries
-    files = list(set(files))
+    files = list({(item['projectID'], item['fileID']) for item in manifest.get('files', [])})
     
-    print(f"Processing information for {len(files)} files...")
+    logger.info("Processing information for %d files...", len(files))
     
-    # Check cache first for all file IDs
+    # Check cache first for all file IDs, collecting the misses in one pass
+    to_scrape = files
     if cache:
-        for file_tuple in files[:]:  # Create a copy to modify while iterating
-            pid, fid = file_tuple
-            cached_info = cache.get_file_info(pid, fid)
+        cache.warmup_files(files)
+        to_scrape = []
+        for file_tuple in files:
+            cached_info = cache.get_file_info(*file_tuple)
             if cached_info:
                 file_info[file_tuple] = cached_info
-                files.remove(file_tuple)
+            else:
+                to_scrape.append(file_tuple)
+    
+    # Batch-fetch the remaining files from the API if possible
+    if to_scrape and api_key:
+        logger.info("Fetching information for %d files from the CurseForge API...", len(to_scrape))
+        fetched = fetch_files_batch(to_scrape, api_key, session)
+        for file_tuple, result in fetched.items():
+            file_info[file_tuple] = result
+            if cache:
+                cache.set_file_info(*file_tuple, result)
+        to_scrape = [file_tuple for file_tuple in to_scrape if file_tuple not in fetched]
     
     # Only scrape the remaining files
-    if files:
-        print(f"Scraping information for {len(files)} files (not in cache)...")
+    if to_scrape:
+        logger.info("Scraping information for %d files (not in cache)...", len(to_scrape))
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {executor.submit(scrape_file_info, pid, fid, cache): (pid, fid) for pid, fid in files}
-            for future in futures:
+        if session is None:
+            session = _SESSION
+        rate_limiter = RateLimiter(delay)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(scrape_file_info, pid, fid, cache, session, rate_limiter): (pid, fid) for pid, fid in to_scrape}
+            # Handle results as they finish rather than in submission order
+            for future in as_completed(futures):
                 pid, fid = futures[future]
                 try:
                     result = future.result()
                     if result:
                         file_info[(pid, fid)] = result
-                        print(f"Scraped info for file {result.get('fileName', f'File-{fid}')} (Project: {pid})")
-                    # Add a small delay to avoid overwhelming the server
-                    time.sleep(0.5)
+                        logger.debug("Scraped info for file %s (Project: %s)", result.get('fileName', f'File-{fid}'), pid)
                 except Exception as e:
-                    print(f"Error processing file {fid} of project {pid}: {e}", file=sys.stderr)
+                    logger.error("Error processing file %s of project %s: %s", fid, pid, e)
     
     return file_info
 
 
+# Fixed changelog table headers
+_MODS_TABLE_HEADER = (
+    "| Project ID | Mod Name | File Name | Version | Required |\n"
+    "|-----------|----------|-----------|---------|----------|\n"
+)
+_MODS_BASIC_TABLE_HEADER = (
+    "| Project ID | File ID | Required |\n"
+    "|-----------|---------|----------|\n"
+)
+_UPDATES_TABLE_HEADER = (
+    "| Project ID | Mod Name | From Version | To Version |\n"
+    "|-----------|----------|--------------|------------|\n"
+)
+_UPDATES_BASIC_TABLE_HEADER = (
+    "| Project ID | Old File ID | New File ID |\n"
+    "|-----------|------------|------------|\n"
+)
+
+# Column accessors for the changelog tables
+_get_ids = itemgetter('projectID', 'fileID')
+_get_update_ids = itemgetter('projectID', 'old_fileID', 'new_fileID')
+
+
+def _required_str(mod: Dict[str, Any]) -> str:
+    """Render a manifest entry's 'required' flag, skipping str() for the usual booleans."""
+    required = mod.get('required', False)
+    if required is True:
+        return "True"
+    if required is False:
+        return "False"
+    return str(required)
+
+
+def _file_version(file_data: Dict[str, Any]) -> str:
+    """Return the display version of a file, falling back to its file name."""
+    return file_data.get('displayName') or file_data.get('fileName') or 'Unknown'
+
+
 def generate_markdown(old_manifest: Dict[str, Any], new_manifest: Dict[str, Any], 
                       additions: List, removals: List, updates: List,
                       old_mod_info: Dict[int, Dict[str, Any]] = None,
@@ -461,144 +882,140 @@ def generate_markdown(old_manifest: Dict[str, Any], new_manifest: Dict[str, Any]
     old_name = old_manifest.get('name', 'Unknown')
     new_name = new_manifest.get('name', 'Unknown')
     
-    markdown = f"# Manifest Comparison\n\n"
-    markdown += f"Comparing {old_name} v{old_version} to {new_name} v{new_version}\n\n"
+    parts = []
+    append = parts.append
+    
+    append("# Manifest Comparison\n\n")
+    append(f"Comparing {old_name} v{old_version} to {new_name} v{new_version}\n\n")
     
     # Minecraft version and loader comparison
     old_mc = old_manifest.get('minecraft', {}).get('version', 'Unknown')
     new_mc = new_manifest.get('minecraft', {}).get('version', 'Unknown')
     
     if old_mc != new_mc:
-        markdown += f"## Minecraft Version Change\n\n"
-        markdown += f"- Changed from `{old_mc}` to `{new_mc}`\n\n"
+        append(f"## Minecraft Version Change\n\n")
+        append(f"- Changed from `{old_mc}` to `{new_mc}`\n\n")
     
     # Mod loader comparison
     old_loaders = old_manifest.get('minecraft', {}).get('modLoaders', [])
     new_loaders = new_manifest.get('minecraft', {}).get('modLoaders', [])
     
     if old_loaders != new_loaders:
-        markdown += f"## Mod Loader Changes\n\n"
-        markdown += "### Old Loaders:\n"
+        append(f"## Mod Loader Changes\n\n")
+        append("### Old Loaders:\n")
         for loader in old_loaders:
             primary = "primary" if loader.get('primary', False) else "secondary"
-            markdown += f"- `{loader.get('id', 'Unknown')}` ({primary})\n"
+            append(f"- `{loader.get('id', 'Unknown')}` ({primary})\n")
         
-        markdown += "\n### New Loaders:\n"
+        append("\n### New Loaders:\n")
         for loader in new_loaders:
             primary = "primary" if loader.get('primary', False) else "secondary"
-            markdown += f"- `{loader.get('id', 'Unknown')}` ({primary})\n\n"
+            append(f"- `{loader.get('id', 'Unknown')}` ({primary})\n\n")
     
     # Additions section
     if additions:
-        markdown += "## Additions\n\n"
+        append("## Additions\n\n")
         
         # Enhanced table with mod names if API info is available
         if new_mod_info and file_info:
-            markdown += "| Project ID | Mod Name | File Name | Version | Required |\n"
-            markdown += "|-----------|----------|-----------|---------|----------|\n"
+            append(_MODS_TABLE_HEADER)
             for mod in additions:
-                project_id = mod['projectID']
-                file_id = mod['fileID']
-                required = str(mod.get('required', False))
+                project_id, file_id = _get_ids(mod)
+                required = _required_str(mod)
                 
                 mod_name = "Unknown"
                 file_name = "Unknown"
                 version = "Unknown"
                 
-                if project_id in new_mod_info:
-                    mod_name = new_mod_info[project_id].get('name', 'Unknown')
+                mod_data = new_mod_info.get(project_id)
+                if mod_data is not None:
+                    mod_name = mod_data.get('name', 'Unknown')
                 
-                if (project_id, file_id) in file_info:
-                    file_data = file_info[(project_id, file_id)]
+                file_data = file_info.get((project_id, file_id))
+                if file_data is not None:
                     file_name = file_data.get('fileName', 'Unknown')
-                    version = file_data.get('displayName', file_data.get('fileName', 'Unknown'))
+                    version = _file_version(file_data)
                 
-                markdown += f"| {project_id} | {mod_name} | {file_name} | {version} | {required} |\n"
+                append(f"| {project_id} | {mod_name} | {file_name} | {version} | {required} |\n")
         else:
             # Basic table without API info
-            markdown += "| Project ID | File ID | Required |\n"
-            markdown += "|-----------|---------|----------|\n"
+            append(_MODS_BASIC_TABLE_HEADER)
             for mod in additions:
-                required = str(mod.get('required', False))
-                markdown += f"| {mod['projectID']} | {mod['fileID']} | {required} |\n"
+                project_id, file_id = _get_ids(mod)
+                required = _required_str(mod)
+                append(f"| {project_id} | {file_id} | {required} |\n")
         
-        markdown += "\n"
+        append("\n")
     
     # Removals section
     if removals:
-        markdown += "## Removals\n\n"
+        append("## Removals\n\n")
         
         # Enhanced table with mod names if API info is available
         if old_mod_info and file_info:
-            markdown += "| Project ID | Mod Name | File Name | Version | Required |\n"
-            markdown += "|-----------|----------|-----------|---------|----------|\n"
+            append(_MODS_TABLE_HEADER)
             for mod in removals:
-                project_id = mod['projectID']
-                file_id = mod['fileID']
-                required = str(mod.get('required', False))
+                project_id, file_id = _get_ids(mod)
+                required = _required_str(mod)
                 
                 mod_name = "Unknown"
                 file_name = "Unknown"
                 version = "Unknown"
                 
-                if project_id in old_mod_info:
-                    mod_name = old_mod_info[project_id].get('name', 'Unknown')
+                mod_data = old_mod_info.get(project_id)
+                if mod_data is not None:
+                    mod_name = mod_data.get('name', 'Unknown')
                 
-                if (project_id, file_id) in file_info:
-                    file_data = file_info[(project_id, file_id)]
+                file_data = file_info.get((project_id, file_id))
+                if file_data is not None:
                     file_name = file_data.get('fileName', 'Unknown')
-                    version = file_data.get('displayName', file_data.get('fileName', 'Unknown'))
+                    version = _file_version(file_data)
                 
-                markdown += f"| {project_id} | {mod_name} | {file_name} | {version} | {required} |\n"
+                append(f"| {project_id} | {mod_name} | {file_name} | {version} | {required} |\n")
         else:
             # Basic table without API info
-            markdown += "| Project ID | File ID | Required |\n"
-            markdown += "|-----------|---------|----------|\n"
+            append(_MODS_BASIC_TABLE_HEADER)
             for mod in removals:
-                required = str(mod.get('required', False))
-                markdown += f"| {mod['projectID']} | {mod['fileID']} | {required} |\n"
+                project_id, file_id = _get_ids(mod)
+                required = _required_str(mod)
+                append(f"| {project_id} | {file_id} | {required} |\n")
         
-        markdown += "\n"
+        append("\n")
     
     # Updates section
     if updates:
-        markdown += "## Updates\n\n"
+        append("## Updates\n\n")
         
         # Enhanced table with mod names if API info is available
         if new_mod_info and file_info:
-            markdown += "| Project ID | Mod Name | From Version | To Version |\n"
-            markdown += "|-----------|----------|--------------|------------|\n"
-            for mod in updates:
-                project_id = mod['projectID']
-                old_file_id = mod['old_fileID']
-                new_file_id = mod['new_fileID']
-                
+            append(_UPDATES_TABLE_HEADER)
+            for project_id, old_file_id, new_file_id in map(_get_update_ids, updates):
                 mod_name = "Unknown"
                 old_version = "Unknown"
                 new_version = "Unknown"
                 
-                if project_id in new_mod_info:
-                    mod_name = new_mod_info[project_id].get('name', 'Unknown')
+                mod_data = new_mod_info.get(project_id)
+                if mod_data is not None:
+                    mod_name = mod_data.get('name', 'Unknown')
                 
-                if (project_id, old_file_id) in file_info:
-                    file_data = file_info[(project_id, old_file_id)]
-                    old_version = file_data.get('displayName', file_data.get('fileName', 'Unknown'))
+                file_data = file_info.get((project_id, old_file_id))
+                if file_data is not None:
+                    old_version = _file_version(file_data)
                 
-                if (project_id, new_file_id) in file_info:
-                    file_data = file_info[(project_id, new_file_id)]
-                    new_version = file_data.get('displayName', file_data.get('fileName', 'Unknown'))
+                file_data = file_info.get((project_id, new_file_id))
+                if file_data is not None:
+                    new_version = _file_version(file_data)
                 
-                markdown += f"| {project_id} | {mod_name} | {old_version} | {new_version} |\n"
+                append(f"| {project_id} | {mod_name} | {old_version} | {new_version} |\n")
         else:
             # Basic table without API info
-            markdown += "| Project ID | Old File ID | New File ID |\n"
-            markdown += "|-----------|------------|------------|\n"
-            for mod in updates:
-                markdown += f"| {mod['projectID']} | {mod['old_fileID']} | {mod['new_fileID']} |\n"
+            append(_UPDATES_BASIC_TABLE_HEADER)
+            for project_id, old_file_id, new_file_id in map(_get_update_ids, updates):
+                append(f"| {project_id} | {old_file_id} | {new_file_id} |\n")
         
-        markdown += "\n"
+        append("\n")
     
-    return markdown
+    return "".join(parts)
 
 
 def main():
@@ -612,10 +1029,18 @@ def main():
     parser.add_argument('--max-workers', type=int, default=3, help='Maximum number of parallel workers (default: 3)')
     parser.add_argument('--cache-dir', type=str, default='.cursecache', help='Directory for cache files (default: .cursecache)')
     parser.add_argument('--no-cache', action='store_true', help='Disable caching')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log every scraped mod and file')
+    parser.add_argument('--api-key', type=str, default=os.environ.get('CF_API_KEY'),
+                        help='CurseForge API key for batched lookups instead of scraping (default: $CF_API_KEY)')
     
     try:
         args = parser.parse_args()
         
+        # Progress goes to stderr so markdown on stdout stays clean
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        if args.verbose:
+            logger.setLevel(logging.DEBUG)
+        
         old_manifest = extract_manifest(args.old_zip)
         new_manifest = extract_manifest(args.new_zip)
         
@@ -629,40 +1054,41 @@ def main():
             cache = None
             if not args.no_cache:
                 cache = CurseForgeCache(args.cache_dir)
-                print(f"Using cache directory: {args.cache_dir}")
-            
-            # Scrape mod information
-            old_mod_info = scrape_all_mod_info(old_manifest, cache)
+                logger.info("Using cache directory: %s", args.cache_dir)
             
-            # Only scrape new mod info if there are different projects
+            # Scrape mod information once for every project in either manifest
             old_project_ids = {item['projectID'] for item in old_manifest.get('files', [])}
             new_project_ids = {item['projectID'] for item in new_manifest.get('files', [])}
-            if old_project_ids != new_project_ids:
-                new_mod_info = scrape_all_mod_info(new_manifest, cache)
-            else:
-                new_mod_info = old_mod_info
+            all_projects_manifest = {"files": [{"projectID": pid, "fileID": 0} for pid in old_project_ids | new_project_ids]}
+            all_mod_info = scrape_all_mod_info(all_projects_manifest, cache, max_workers=args.max_workers, delay=args.delay, api_key=args.api_key)
+            
+            # Split the combined result back into the old and new views
+            old_mod_info = {pid: all_mod_info[pid] for pid in old_project_ids if pid in all_mod_info}
+            new_mod_info = {pid: all_mod_info[pid] for pid in new_project_ids if pid in all_mod_info}
             
             # Scrape file information if not disabled
             if not args.no_scrape_files:
                 # Create combined manifest for file info scraping
                 all_files = []
-                for item in old_manifest.get('files', []):
-                    all_files.append({"projectID": item['projectID'], "fileID": item['fileID']})
-                for item in new_manifest.get('files', []):
+                seen = set()
+                for item in itertools.chain(old_manifest.get('files', []), new_manifest.get('files', [])):
+                    key = (item['projectID'], item['fileID'])
                     # Skip if already added
-                    if not any(f['projectID'] == item['projectID'] and f['fileID'] == item['fileID'] for f in all_files):
-                        all_files.append({"projectID": item['projectID'], "fileID": item['fileID']})
+                    if key not in seen:
+                        seen.add(key)
+                        all_files.append({"projectID": key[0], "fileID": key[1]})
                 
                 combined_manifest = {"files": all_files}
-                file_info = scrape_all_file_info(combined_manifest, cache)
+                file_info = scrape_all_file_info(combined_manifest, cache, max_workers=args.max_workers, delay=args.delay, api_key=args.api_key)
             
             # Print cache statistics if cache was used
             if cache:
                 stats = cache.get_stats()
-                print(f"\nCache statistics:")
-                print(f"  Mod info: {stats['mod_hits']} hits, {stats['mod_misses']} misses")
-                print(f"  File info: {stats['file_hits']} hits, {stats['file_misses']} misses")
-                print(f"  Total: {stats['total_hits']} hits, {stats['total_misses']} misses")
+                logger.info("Cache statistics:")
+                logger.info("  Mod info: %d hits, %d misses", stats['mod_hits'], stats['mod_misses'])
+                logger.info("  File info: %d hits, %d misses", stats['file_hits'], stats['file_misses'])
+                logger.info("  Total: %d hits, %d misses", stats['total_hits'], stats['total_misses'])
+                cache.close()
         
         additions, removals, updates = compare_manifests(old_manifest, new_manifest)
         markdown = generate_markdown(old_manifest, new_manifest, additions, removals, updates, 